@@ -1,112 +1,49 @@
 from __future__ import annotations
+import io
+import sys
 import time
-import random
 import argparse
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Sequence, TextIO
 
-class NReinas:
-    """
-    Resolver del problema de las N-Reinas.
-    Representación: vector de tamaño n donde el índice es la columna y el valor la fila.
-    """
-
-    def __init__(self, n: int, seed: Optional[int] = None) -> None:
-        if n < 1:
-            raise ValueError("n debe ser >= 1")
-        self.n: int = n
-        self.soluciones: List[List[int]] = []
-        if seed is not None:
-            random.seed(seed)
-
-    def limpiar(self) -> None:
-        """Limpia las soluciones almacenadas."""
-        self.soluciones.clear()
-
-    def es_valida(self, solucion: List[int], fila: int, columna: int) -> bool:
-        """Comprueba si colocar una reina en (fila, columna) es válido respecto a columnas previas."""
-        for col in range(columna):
-            if solucion[col] == fila or abs(solucion[col] - fila) == abs(col - columna):
-                return False
-        return True
-
-    def resolver(self) -> None:
-        """Encuentra todas las soluciones por backtracking y las almacena en self.soluciones."""
-        self.limpiar()
-        solucion = [-1] * self.n
-        self._backtrack(0, solucion)
-
-    def _backtrack(self, columna: int, solucion: List[int]) -> None:
-        if columna == self.n:
-            self.soluciones.append(solucion.copy())
-            return
-        for fila in range(self.n):
-            if self.es_valida(solucion, fila, columna):
-                solucion[columna] = fila
-                self._backtrack(columna + 1, solucion)
-                solucion[columna] = -1  # deshacer
-
-    # --------- Enfoque probabilista (min-conflicts) para hallar UNA solución rápida ----------
-    def conflictos_en(self, solucion: List[int], columna: int, fila: int) -> int:
-        """Cuenta conflictos de ubicar (columna -> fila) respecto al resto de columnas."""
-        conflictos = 0
-        for c in range(self.n):
-            if c == columna:
-                continue
-            f = solucion[c]
-            if f == -1:
-                continue
-            if f == fila or abs(f - fila) == abs(c - columna):
-                conflictos += 1
-        return conflictos
+from nreinas import NReinas
 
-    def resolver_probabilista(self, max_pasos: int = 10_000, reinicios: int = 50) -> Optional[List[int]]:
-        """
-        Min-conflicts: intenta hallar una solución válida (no garantiza todas).
-        Devuelve una solución o None si no encontró en los reinicios dados.
-        """
-        for _ in range(reinicios):
-            solucion = [random.randrange(self.n) for _ in range(self.n)]
-            for _ in range(max_pasos):
-                conflicted_cols = [c for c in range(self.n) if self.conflictos_en(solucion, c, solucion[c]) > 0]
-                if not conflicted_cols:
-                    return solucion.copy()
-                col = random.choice(conflicted_cols)
-                # Mover a la fila con menos conflictos (romper empates al azar)
-                mejor_filas: List[int] = []
-                mejor_conf: Optional[int] = None
-                for fila in range(self.n):
-                    conf = self.conflictos_en(solucion, col, fila)
-                    if mejor_conf is None or conf < mejor_conf:
-                        mejor_conf = conf
-                        mejor_filas = [fila]
-                    elif conf == mejor_conf:
-                        mejor_filas.append(fila)
-                solucion[col] = random.choice(mejor_filas)
-        return None
-
-    # --------------------- Utilidades ---------------------
-    def cantidad_soluciones(self) -> int:
-        return len(self.soluciones)
+def _escribir_soluciones(
+    salida: TextIO, solver: "NReinas", soluciones: Iterable[Sequence[int]], mostrar_tablero: bool
+) -> None:
+    """Escribe las soluciones (y sus tableros) en `salida` con el mismo formato que print."""
+    escribir = salida.write
+    for i, sol in enumerate(soluciones, 1):
+        escribir(f"- Solución {i}: {list(sol)}\n")
+        if mostrar_tablero:
+            escribir(solver.tablero_str(sol))
+            escribir(" \n\n")
 
-    def tablero_str(self, solucion: List[int]) -> str:
-        """Devuelve una representación ASCII del tablero para una solución."""
-        filas = []
-        for r in range(self.n):
-            fila = "".join("Q " if solucion[c] == r else ". " for c in range(self.n))
-            filas.append(fila.rstrip())
-        return "\n".join(filas)
 
-def _imprimir_soluciones(solver: "NReinas", mostrar_soluciones: bool, mostrar_tablero: bool, limite: int) -> None:
+def _imprimir_soluciones(
+    solver: "NReinas",
+    mostrar_soluciones: bool,
+    mostrar_tablero: bool,
+    limite: int,
+    salida: TextIO,
+    guardadas: bool = True,
+) -> None:
+    """
+    Muestra hasta `limite` soluciones (limite <= 0 = todas). Con guardadas=True se toman
+    de solver.soluciones (las que dejó resolver() o resolver_paralelo()); si el solver
+    solo contó, se generan a demanda y solo se busca hasta la última a mostrar.
+    """
     if not mostrar_soluciones:
         return
-    if limite is not None and limite > 0:
-        to_show = solver.soluciones[:limite]
+    con_limite = limite is not None and limite > 0
+    to_show: Iterable[Sequence[int]]
+    if guardadas:
+        to_show = solver.soluciones[:limite] if con_limite else solver.soluciones
+    elif con_limite:
+        to_show = islice(solver.iter_soluciones(), limite)
     else:
-        to_show = solver.soluciones
-    for i, sol in enumerate(to_show, 1):
-        print(f"- Solución {i}: {sol}")
-        if mostrar_tablero:
-            print(solver.tablero_str(sol), "\n")
+        to_show = solver.iter_soluciones()
+    _escribir_soluciones(salida, solver, to_show, mostrar_tablero)
 
 
 def ejecutar_experimento(
@@ -129,11 +66,19 @@ def ejecutar_experimento(
     for n in range(n_inicio, n_fin + 1):
         solver = NReinas(n)
         t0 = time.perf_counter()
-        solver.resolver()
+        # Solo hace falta guardarlas si se muestran todas; con límite se generan al imprimir
+        mostrar_todas = mostrar_soluciones and not (limite_impresion is not None and limite_impresion > 0)
+        solver.resolver(solo_contar=not mostrar_todas)
         t1 = time.perf_counter()
-        existe = "Sí" if solver.cantidad_soluciones() > 0 else "No"
-        print(f"{n:>2}  {existe:>9}  {solver.cantidad_soluciones():>12}  {t1 - t0:>10.4f}")
-        _imprimir_soluciones(solver, mostrar_soluciones, mostrar_tablero, limite_impresion)
+        total = solver.cantidad_soluciones()
+        existe = "Sí" if total > 0 else "No"
+        # Todo lo de este n se acumula en memoria y se escribe de una vez
+        buf = io.StringIO()
+        buf.write(f"{n:>2}  {existe:>9}  {total:>12}  {t1 - t0:>10.4f}\n")
+        _imprimir_soluciones(
+            solver, mostrar_soluciones, mostrar_tablero, limite_impresion, buf, guardadas=mostrar_todas
+        )
+        sys.stdout.write(buf.getvalue())
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Resolver N-Reinas (backtracking y min-conflicts).")
@@ -144,6 +89,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--seed", type=int, default=None, help="Semilla para aleatoriedad (opcional).")
     parser.add_argument("--metodo", choices=["backtracking", "probabilista"], default="backtracking",
                         help="Método de resolución.")
+    parser.add_argument("--paralelo", action="store_true",
+                        help="Backtracking repartido entre procesos (útil para n >= 11).")
     parser.add_argument("--mostrar-soluciones", action="store_true", help="Imprime soluciones encontradas.")
     parser.add_argument("--mostrar-tablero", action="store_true", help="Imprime tablero ASCII de las soluciones.")
     parser.add_argument("--limite-impresion", type=int, default=5, help="Máx. soluciones a imprimir (<=0 = todas).")
@@ -172,19 +119,15 @@ def main() -> None:
 
     if args.metodo == "backtracking":
         t0 = time.perf_counter()
-        solver.resolver()
+        if args.paralelo:
+            solver.resolver_paralelo()
+        else:
+            solver.resolver()
         t1 = time.perf_counter()
         print(f"n={args.n}: {solver.cantidad_soluciones()} soluciones en {t1 - t0:.4f}s")
-        if args.mostrar_soluciones:
-            # Si limite_impresion <= 0, mostrar todas las soluciones
-            if args.limite_impresion is not None and args.limite_impresion > 0:
-                to_show = solver.soluciones[: args.limite_impresion]
-            else:
-                to_show = solver.soluciones
-            for i, sol in enumerate(to_show, 1):
-                print(f"- Solución {i}: {sol}")
-                if args.mostrar_tablero:
-                    print(solver.tablero_str(sol), "\n")
+        buf = io.StringIO()
+        _imprimir_soluciones(solver, args.mostrar_soluciones, args.mostrar_tablero, args.limite_impresion, buf)
+        sys.stdout.write(buf.getvalue())
     else:
         t0 = time.perf_counter()
         sol = solver.resolver_probabilista(max_pasos=args.max_pasos, reinicios=args.reinicios)
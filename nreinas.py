@@ -0,0 +1,496 @@
+"""
+Resolver del problema de las N-Reinas (backtracking, min-conflicts y utilidades).
+Puede compilarse a una extensión C con mypyc (ver setup.py); main.py lo usa igual.
+"""
+from __future__ import annotations
+import random
+import multiprocessing
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # sin numpy: min-conflicts evalúa las filas con bucles de Python
+    np = None  # type: ignore[assignment]
+
+
+def _es_valida_py(solucion: Sequence[int], fila: int, columna: int) -> bool:
+    # De la columna más cercana hacia atrás: las vecinas son las que más suelen chocar,
+    # y dc (distancia en columnas) sale directo del range.
+    for dc in range(1, columna + 1):
+        # Misma fila (d == 0) o misma diagonal (|d| == dc), sin llamar a abs()
+        d = solucion[columna - dc] - fila
+        if d == 0 or d == dc or d == -dc:
+            return False
+    return True
+
+
+def _conflictos_en_py(solucion: Sequence[int], columna: int, fila: int, n: int) -> int:
+    conflictos = 0
+    for c in range(n):
+        if c == columna:
+            continue
+        f = solucion[c]
+        if f == -1:
+            continue
+        if f == fila or abs(f - fila) == abs(c - columna):
+            conflictos += 1
+    return conflictos
+
+
+try:
+    # Versiones compiladas (nreinas_core.pyx); esperan array('i') en lugar de listas.
+    from nreinas_core import es_valida as _es_valida, conflictos_en as _conflictos_en  # type: ignore[import-not-found]
+    _CORE_C = True
+except ImportError:  # extensión no compilada: NReinas usa las versiones en Python
+    _CORE_C = False
+
+
+def _acepta_core_c(solucion: Sequence[int], largo: int) -> bool:
+    """
+    True si `solucion` puede pasarse tal cual a la extensión C: un array("i") con al
+    menos `largo` elementos (la extensión no revisa límites). Las listas, otros arrays
+    o arrays cortos van a la versión en Python, que lanza IndexError si faltan columnas.
+    """
+    return _CORE_C and isinstance(solucion, array) and solucion.typecode == "i" and len(solucion) >= largo
+
+# Por debajo de este n el costo fijo de cada operación de NumPy supera al bucle en Python.
+_N_MIN_NUMPY = 64
+# Por debajo de este n resolver_paralelo no compensa el costo de lanzar procesos.
+_N_MIN_PARALELO = 11
+# Por debajo de este n el backtracking en Python tarda menos que importar numba y cargar
+# las funciones compiladas de su caché (~0.5 s; varios segundos si hay que compilar).
+_N_MIN_NUMBA = 13
+
+_numba: Any = None
+_numba_probado = False
+
+
+def _cargar_numba() -> Any:
+    """Importa nreinas_numba la primera vez que se pide; None si numba/numpy no están."""
+    global _numba, _numba_probado
+    if not _numba_probado:
+        _numba_probado = True
+        try:
+            import nreinas_numba
+            _numba = nreinas_numba
+        except ImportError:  # sin numba/numpy: se usa el backtracking en Python puro
+            _numba = None
+    return _numba
+
+
+def _numba_para(n: int) -> Any:
+    """nreinas_numba si conviene usarlo para este n (y está instalado); si no, None."""
+    if n < _N_MIN_NUMBA:
+        return None
+    numba = _cargar_numba()
+    if numba is None or n > numba.MAX_N:
+        return None
+    return numba
+
+
+def _estado_prefijo(n: int, prefijo: Sequence[int]) -> Optional[Tuple[int, int, int]]:
+    """Máscaras (cols, diag1, diag2) tras colocar `prefijo`, o None si tiene reinas en conflicto."""
+    mascara = (1 << n) - 1
+    cols = diag1 = diag2 = 0
+    for fila in prefijo:
+        bit = 1 << fila
+        if bit & (cols | diag1 | diag2):
+            return None
+        cols |= bit
+        diag1 = ((diag1 | bit) << 1) & mascara
+        diag2 = (diag2 | bit) >> 1
+    return cols, diag1, diag2
+
+
+def _iter_desde(n: int, prefijo: Sequence[int]) -> Iterator[Tuple[int, ...]]:
+    """
+    Genera, en orden lexicográfico, las soluciones que empiezan con `prefijo`.
+    Backtracking con máscaras de bits sin recursión: cols marca filas ocupadas,
+    diag1/diag2 las diagonales atacadas en la columna actual (desplazadas en cada
+    paso) y libres las filas que quedan por probar; la pila guarda ese estado por nivel.
+
+    No se memoizan las completaciones por estado (cols, diag1, diag2): casi todos los
+    estados son distintos (n=12, profundidad 9: 222720 visitas, 188100 estados) y la
+    tabla resultó 2-3 veces más lenta que recorrer el subárbol de nuevo.
+    """
+    estado = _estado_prefijo(n, prefijo)
+    if estado is None:
+        return
+    cols, diag1, diag2 = estado
+    prof = len(prefijo)
+    camino = list(prefijo) + [0] * (n - prof)
+    if prof == n:
+        yield tuple(camino)
+        return
+    mascara = (1 << n) - 1
+    ultima = n - 1
+    pila: List[Tuple[int, int, int, int]] = []
+    libres = ~(cols | diag1 | diag2) & mascara
+    while True:
+        if libres:
+            bit = libres & -libres  # bit libre más bajo = fila más baja
+            libres ^= bit
+            camino[prof] = bit.bit_length() - 1
+            if prof == ultima:
+                yield tuple(camino)
+                continue
+            pila.append((cols, diag1, diag2, libres))
+            cols |= bit
+            diag1 = ((diag1 | bit) << 1) & mascara
+            diag2 = (diag2 | bit) >> 1
+            libres = ~(cols | diag1 | diag2) & mascara
+            prof += 1
+        elif pila:
+            cols, diag1, diag2, libres = pila.pop()  # deshacer
+            prof -= 1
+        else:
+            return
+
+
+def _tipo_fila(n: int) -> str:
+    """Código de array.array para guardar filas 0..n-1: un byte por reina mientras alcance."""
+    return "b" if n <= 128 else "h"
+
+
+def _soluciones_desde(n: int, prefijo: Sequence[int]) -> List[array[int]]:
+    """Todas las soluciones cuyas primeras columnas coinciden con `prefijo`."""
+    tipo = _tipo_fila(n)
+    return [array(tipo, sol) for sol in _iter_desde(n, prefijo)]
+
+
+def _contar_desde(n: int, prefijo: Sequence[int]) -> int:
+    """Como _soluciones_desde, pero solo cuenta: no arma caminos ni reserva memoria por solución."""
+    estado = _estado_prefijo(n, prefijo)
+    if estado is None:
+        return 0
+    cols, diag1, diag2 = estado
+    mascara = (1 << n) - 1
+    if cols == mascara:
+        return 1
+    total = 0
+    pila: List[Tuple[int, int, int, int]] = []
+    libres = ~(cols | diag1 | diag2) & mascara
+    while True:
+        if libres:
+            bit = libres & -libres
+            libres ^= bit
+            c = cols | bit
+            if c == mascara:
+                total += 1
+                continue
+            pila.append((cols, diag1, diag2, libres))
+            cols = c
+            diag1 = ((diag1 | bit) << 1) & mascara
+            diag2 = (diag2 | bit) >> 1
+            libres = ~(cols | diag1 | diag2) & mascara
+        elif pila:
+            cols, diag1, diag2, libres = pila.pop()
+        else:
+            return total
+
+
+# n para los que resolver usa un backtracking generado y desenrollado (un bucle anidado
+# por columna). Por debajo de _N_MIN_NUMBA es el camino de resolver en toda instalación
+# (con o sin numba), incluido el -n 8 por defecto: ~1.4x más rápido que _iter_desde
+# (n=12: 0.18 s -> 0.13 s). El tope de 16 respeta el límite de 20 bloques anidados de CPython.
+_N_ESPECIALIZADO = range(4, 17)
+_RESOLVERES: Dict[int, Callable[[Iterable[int], Callable[[array[int]], None]], None]] = {}
+
+
+def _fuente_especializada(n: int) -> str:
+    """Código fuente del backtracking desenrollado para un n fijo (máscara como literal)."""
+    mascara = (1 << n) - 1
+    tipo = _tipo_fila(n)
+    lineas = ["def _resolver(filas0, agregar):", "    for r0 in filas0:"]
+    sangria = "        "
+    lineas += [f"{sangria}c0 = 1 << r0", f"{sangria}a0 = (c0 << 1) & {mascara}", f"{sangria}b0 = c0 >> 1"]
+    for k in range(1, n - 1):
+        lineas += [
+            f"{sangria}l{k} = ~(c{k - 1} | a{k - 1} | b{k - 1}) & {mascara}",
+            f"{sangria}while l{k}:",
+        ]
+        sangria += "    "
+        lineas += [
+            f"{sangria}p{k} = l{k} & -l{k}",
+            f"{sangria}l{k} ^= p{k}",
+            f"{sangria}c{k} = c{k - 1} | p{k}",
+            f"{sangria}a{k} = ((a{k - 1} | p{k}) << 1) & {mascara}",
+            f"{sangria}b{k} = (b{k - 1} | p{k}) >> 1",
+        ]
+    # En la última columna queda a lo sumo una fila libre: si existe, es una solución.
+    u = n - 1
+    filas = ", ".join(["r0"] + [f"p{k}.bit_length() - 1" for k in range(1, u)] + [f"l{u}.bit_length() - 1"])
+    lineas += [
+        f"{sangria}l{u} = ~(c{u - 1} | a{u - 1} | b{u - 1}) & {mascara}",
+        f"{sangria}if l{u}:",
+        f"{sangria}    agregar(array({tipo!r}, ({filas})))",
+    ]
+    return "\n".join(lineas) + "\n"
+
+
+def _resolver_especializado(n: int) -> Callable[[Iterable[int], Callable[[array[int]], None]], None]:
+    """
+    Devuelve (generándolo y compilándolo la primera vez) el backtracking desenrollado para n.
+    La función recibe las filas de la primera columna a explorar y `agregar`, al que pasa
+    cada solución en orden lexicográfico.
+    """
+    resolver = _RESOLVERES.get(n)
+    if resolver is None:
+        espacio: Dict[str, Any] = {"array": array}
+        exec(compile(_fuente_especializada(n), f"<nreinas n={n}>", "exec"), espacio)
+        resolver = _RESOLVERES[n] = espacio["_resolver"]
+    return resolver
+
+
+def _resolver_subarbol(semilla: Tuple[int, Tuple[int, ...]]) -> List[array[int]]:
+    """Tarea de resolver_paralelo: recibe (n, prefijo) y devuelve sus soluciones."""
+    n, prefijo = semilla
+    return _soluciones_desde(n, prefijo)
+
+class NReinas:
+    """
+    Resolver del problema de las N-Reinas.
+    Representación: vector de tamaño n donde el índice es la columna y el valor la fila.
+    """
+
+    __slots__ = ("n", "rng", "_soluciones", "_filas", "_cantidad")
+
+    def __init__(self, n: int, seed: Optional[int] = None) -> None:
+        if n < 1:
+            raise ValueError("n debe ser >= 1")
+        self.n: int = n
+        # Cada solución es un array.array compacto (1 byte por columna si n <= 128)
+        self._soluciones: List[array[int]] = []
+        self._filas: Any = None  # matriz de Numba pendiente de convertir a listas
+        self._cantidad: Optional[int] = None  # resultado de resolver(solo_contar=True)
+        # Generador propio: la semilla no altera el estado global de `random`.
+        self.rng: random.Random = random.Random(seed)
+
+    @property
+    def soluciones(self) -> List[array[int]]:
+        """Soluciones halladas; si vienen de Numba se convierten al primer acceso."""
+        if self._filas is not None:
+            # Las filas de Numba son int8, el mismo formato que array("b")
+            self._soluciones = [array("b", fila.tobytes()) for fila in self._filas]
+            self._filas = None
+        return self._soluciones
+
+    def limpiar(self) -> None:
+        """Limpia las soluciones almacenadas."""
+        self._soluciones.clear()
+        self._filas = None
+        self._cantidad = None
+
+    def es_valida(self, solucion: Sequence[int], fila: int, columna: int) -> bool:
+        """Comprueba si colocar una reina en (fila, columna) es válido respecto a columnas previas."""
+        if _acepta_core_c(solucion, columna):
+            return _es_valida(solucion, fila, columna)
+        return _es_valida_py(solucion, fila, columna)
+
+    def resolver(self, *, solo_contar: bool = False) -> None:
+        """
+        Encuentra todas las soluciones por backtracking y las almacena en self.soluciones.
+        Con solo_contar=True no guarda ninguna: solo registra cuántas hay (cantidad_soluciones).
+        """
+        self.limpiar()
+        if solo_contar:
+            self._cantidad = self.contar_soluciones()
+            return
+        n = self.n
+        numba = _numba_para(n)
+        if numba is not None:
+            self._filas = numba.resolver(n)
+            return
+        soluciones = self._soluciones
+        # Simetría vertical: basta explorar la primera columna en la mitad superior
+        # y reflejar (fila -> n-1-fila); la fila central (n impar) se explora completa.
+        mitad = n // 2
+        if n in _N_ESPECIALIZADO:
+            especializado = _resolver_especializado(n)
+            especializado(range(mitad), soluciones.append)
+            n_mitad = len(soluciones)
+            if n % 2 == 1:
+                especializado((mitad,), soluciones.append)
+        else:
+            for fila in range(mitad):
+                soluciones.extend(_soluciones_desde(n, (fila,)))
+            n_mitad = len(soluciones)
+            if n % 2 == 1:
+                soluciones.extend(_soluciones_desde(n, (mitad,)))
+        self._agregar_reflejos(n_mitad)
+
+    def resolver_paralelo(self, procesos: Optional[int] = None) -> None:
+        """
+        Igual que resolver, pero reparte entre procesos los subárboles que cuelgan de
+        las dos primeras columnas (con la misma reducción por simetría).
+        Para n chico el costo de lanzar procesos supera la ganancia y se usa resolver.
+        También se usa resolver si hay backend de Numba para este n: un solo proceso con
+        Numba es más rápido que los procesos en Python puro, y cada proceso tendría que
+        volver a cargar numba.
+        """
+        n = self.n
+        if n < _N_MIN_PARALELO or _numba_para(n) is not None:
+            self.resolver()
+            return
+        self.limpiar()
+        mitad = n // 2
+        semillas = [(n, (f0, f1)) for f0 in range((n + 1) // 2) for f1 in range(n)]
+        with multiprocessing.Pool(procesos) as pool:
+            # map conserva el orden de las semillas, y con él el orden de las soluciones
+            partes = pool.map(_resolver_subarbol, semillas)
+        n_mitad = 0
+        for (_, (f0, _)), parte in zip(semillas, partes):
+            self._soluciones.extend(parte)
+            if f0 < mitad:
+                n_mitad += len(parte)
+        self._agregar_reflejos(n_mitad)
+
+    def iter_soluciones(self) -> Iterator[Tuple[int, ...]]:
+        """Genera las soluciones una a una (orden lexicográfico) sin guardarlas."""
+        return _iter_desde(self.n, ())
+
+    def contar_soluciones(self) -> int:
+        """Cuenta las soluciones sin construirlas ni guardarlas en self.soluciones."""
+        n = self.n
+        numba = _numba_para(n)
+        if numba is not None:
+            return int(numba.contar_soluciones(n))
+        mitad = n // 2
+        total = 2 * sum(_contar_desde(n, (fila,)) for fila in range(mitad))
+        if n % 2 == 1:
+            total += _contar_desde(n, (mitad,))
+        return total
+
+    def _agregar_reflejos(self, n_mitad: int) -> None:
+        """Agrega el reflejo vertical (fila -> n-1-fila) de las primeras n_mitad soluciones."""
+        ultima = self.n - 1
+        tipo = _tipo_fila(self.n)
+        # Reflejar en orden inverso mantiene el orden lexicográfico de las soluciones.
+        self._soluciones.extend(
+            array(tipo, [ultima - f for f in sol]) for sol in reversed(self._soluciones[:n_mitad])
+        )
+
+    # --------- Enfoque probabilista (min-conflicts) para hallar UNA solución rápida ----------
+    def conflictos_en(self, solucion: Sequence[int], columna: int, fila: int) -> int:
+        """Cuenta conflictos de ubicar (columna -> fila) respecto al resto de columnas."""
+        if _acepta_core_c(solucion, self.n):
+            return _conflictos_en(solucion, columna, fila, self.n)
+        return _conflictos_en_py(solucion, columna, fila, self.n)
+
+    def resolver_probabilista(self, max_pasos: int = 10_000, reinicios: int = 50) -> Optional[List[int]]:
+        """
+        Min-conflicts: intenta hallar una solución válida (no garantiza todas).
+        Devuelve una solución o None si no encontró en los reinicios dados.
+        """
+        n = self.n
+        ultima = n - 1
+        randrange = self.rng.randrange
+        choice = self.rng.choice
+        usar_numpy = np is not None and n >= _N_MIN_NUMPY
+        # Reinas por fila y por diagonal en un único arreglo, así los conflictos de una
+        # casilla salen en O(1): contadores[fila], contadores[d1 + fila + columna] y
+        # contadores[d2 + fila - columna] (las diagonales fila - columna van desplazadas n - 1).
+        d1 = n
+        d2 = n + (2 * n - 1) + ultima
+        tam = n + 2 * (2 * n - 1)
+        for _ in range(reinicios):
+            solucion = array("i", [randrange(n) for _ in range(n)])
+            contadores: Any = [0] * tam
+            # Suma de las columnas de las reinas de cada línea: si en una línea queda
+            # una sola reina, la suma es justo su columna.
+            sumas = [0] * tam
+            for c, f in enumerate(solucion):
+                for linea in (f, d1 + f + c, d2 + f - c):
+                    contadores[linea] += 1
+                    sumas[linea] += c
+            if usar_numpy:
+                contadores = np.array(contadores, dtype=np.int32)
+            # Columnas en conflicto (cada reina se cuenta a sí misma en sus tres contadores).
+            # Se mantienen entre pasos: lista para sortear en O(1) y posición de cada columna
+            # en la lista (-1 si no está) para agregar y quitar en O(1).
+            conflictivas = [
+                c for c, f in enumerate(solucion)
+                if contadores[f] + contadores[d1 + f + c] + contadores[d2 + f - c] > 3
+            ]
+            posicion = [-1] * n
+            for i, c in enumerate(conflictivas):
+                posicion[c] = i
+
+            def marcar(c: int) -> None:
+                if posicion[c] < 0:
+                    posicion[c] = len(conflictivas)
+                    conflictivas.append(c)
+
+            def desmarcar(c: int) -> None:
+                i = posicion[c]
+                if i >= 0:
+                    ultima_col = conflictivas.pop()
+                    if ultima_col != c:
+                        conflictivas[i] = ultima_col
+                        posicion[ultima_col] = i
+                    posicion[c] = -1
+
+            for _ in range(max_pasos):
+                if not conflictivas:
+                    return solucion.tolist()
+                col = conflictivas[randrange(len(conflictivas))]
+                # Retirar la reina de col para que los contadores solo vean al resto. Solo puede
+                # dejar de estar en conflicto la reina que quede sola en alguna de sus líneas.
+                actual = solucion[col]
+                for linea in (actual, d1 + actual + col, d2 + actual - col):
+                    contadores[linea] -= 1
+                    sumas[linea] -= col
+                    if contadores[linea] == 1:
+                        c = sumas[linea]
+                        f = solucion[c]
+                        if contadores[f] + contadores[d1 + f + c] + contadores[d2 + f - c] == 3:
+                            desmarcar(c)
+                # Mover a la fila con menos conflictos (romper empates al azar)
+                mejor_filas: Any
+                if usar_numpy:
+                    # fila + col y fila - col recorren tramos contiguos de las diagonales
+                    conf_filas = contadores[:n] + contadores[d1 + col:d1 + col + n] + contadores[d2 - col:d2 - col + n]
+                    mejor_filas = np.flatnonzero(conf_filas == conf_filas.min())
+                else:
+                    mejor_filas = []
+                    mejor_conf: Optional[int] = None
+                    for fila in range(n):
+                        conf = contadores[fila] + contadores[d1 + fila + col] + contadores[d2 + fila - col]
+                        if mejor_conf is None or conf < mejor_conf:
+                            mejor_conf = conf
+                            mejor_filas = [fila]
+                        elif conf == mejor_conf:
+                            mejor_filas.append(fila)
+                nueva = int(choice(mejor_filas))
+                solucion[col] = nueva
+                # Una reina que estaba sola en una línea de la nueva casilla pasa a tener conflicto.
+                for linea in (nueva, d1 + nueva + col, d2 + nueva - col):
+                    if contadores[linea] == 1:
+                        marcar(sumas[linea])
+                    contadores[linea] += 1
+                    sumas[linea] += col
+                if contadores[nueva] + contadores[d1 + nueva + col] + contadores[d2 + nueva - col] > 3:
+                    marcar(col)
+                else:
+                    desmarcar(col)
+        return None
+
+    # --------------------- Utilidades ---------------------
+    def cantidad_soluciones(self) -> int:
+        if self._cantidad is not None:
+            return self._cantidad
+        if self._filas is not None:
+            return len(self._filas)
+        return len(self._soluciones)
+
+    def tablero_str(self, solucion: Sequence[int]) -> str:
+        """Devuelve una representación ASCII del tablero para una solución."""
+        n = self.n
+        ancho = 2 * n  # ". " por casilla, sin espacio final y con salto de línea
+        tablero = bytearray((b". " * (n - 1) + b".\n") * n)
+        del tablero[-1]
+        for c, r in enumerate(solucion):
+            if 0 <= r < n:  # -1 (columna vacía) u otra fila fuera del tablero: sin reina
+                tablero[r * ancho + 2 * c] = 81  # ord("Q")
+        return tablero.decode("ascii")
@@ -0,0 +1,41 @@
+# cython: language_level=3
+"""
+Predicados de N-Reinas en Cython (opcional).
+Compilar con: python setup.py build_ext --inplace
+Solo aceleran los métodos públicos NReinas.es_valida / conflictos_en cuando quien los
+llama pasa un array('i'); ningún camino interno del resolver los usa. Sin revisión de
+límites: NReinas verifica el largo del array antes de llamarlos.
+Sin la extensión compilada, nreinas.py usa las versiones equivalentes en Python.
+"""
+cimport cython
+from libc.stdlib cimport abs as c_abs
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef bint es_valida(int[::1] solucion, int fila, int columna) noexcept nogil:
+    """Comprueba si colocar una reina en (fila, columna) es válido respecto a columnas previas."""
+    cdef int dc, d
+    # De la columna más cercana hacia atrás: las vecinas son las que más suelen chocar.
+    for dc in range(1, columna + 1):
+        d = solucion[columna - dc] - fila
+        if d == 0 or c_abs(d) == dc:
+            return False
+    return True
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef int conflictos_en(int[::1] solucion, int columna, int fila, int n) noexcept nogil:
+    """Cuenta conflictos de ubicar (columna -> fila) respecto al resto de columnas."""
+    cdef int c, f
+    cdef int conflictos = 0
+    for c in range(n):
+        if c == columna:
+            continue
+        f = solucion[c]
+        if f == -1:
+            continue
+        if f == fila or c_abs(f - fila) == c_abs(c - columna):
+            conflictos += 1
+    return conflictos
@@ -0,0 +1,112 @@
+"""
+Backtracking con máscaras de bits compilado con Numba (opcional).
+nreinas.py lo importa a demanda, solo para n >= 13 y si numba está instalado;
+si no, usa la versión en Python puro.
+La primera llamada compila las funciones; cache=True guarda el resultado en disco.
+"""
+import numpy as np
+from numba import njit
+
+# Las máscaras son int64: (d1 | bit) << 1 debe caber sin desbordar.
+MAX_N = 62
+
+
+@njit(cache=True)
+def _indice(bit):
+    """Posición del único bit encendido en `bit` (equivale a bit.bit_length() - 1)."""
+    fila = 0
+    while bit > 1:
+        bit >>= 1
+        fila += 1
+    return fila
+
+
+@njit(cache=True)
+def _subarbol(n, fila0, salida, k):
+    """
+    Recorre de forma iterativa el subárbol con la primera reina en `fila0`.
+    Escribe cada solución en salida[k], salida[k + 1], ... mientras quepan; las que no
+    caben solo se cuentan. Devuelve k más la cantidad de soluciones halladas.
+    """
+    capacidad = salida.shape[0]
+    mascara = (1 << n) - 1
+    bit = 1 << fila0
+    if n == 1:
+        if k < capacidad:
+            salida[k, 0] = fila0
+        return k + 1
+    cols = np.zeros(n, np.int64)
+    diag1 = np.zeros(n, np.int64)
+    diag2 = np.zeros(n, np.int64)
+    libres = np.zeros(n, np.int64)
+    camino = np.empty(n, np.int8)
+    camino[0] = fila0
+    cols[1] = bit
+    diag1[1] = (bit << 1) & mascara
+    diag2[1] = bit >> 1
+    libres[1] = ~(cols[1] | diag1[1] | diag2[1]) & mascara
+    prof = 1
+    while prof >= 1:
+        if libres[prof] == 0:
+            prof -= 1
+            continue
+        bit = libres[prof] & -libres[prof]
+        libres[prof] ^= bit
+        camino[prof] = _indice(bit)
+        if prof == n - 1:
+            if k < capacidad:
+                salida[k, :] = camino
+            k += 1
+            continue
+        cols[prof + 1] = cols[prof] | bit
+        diag1[prof + 1] = ((diag1[prof] | bit) << 1) & mascara
+        diag2[prof + 1] = (diag2[prof] | bit) >> 1
+        libres[prof + 1] = ~(cols[prof + 1] | diag1[prof + 1] | diag2[prof + 1]) & mascara
+        prof += 1
+    return k
+
+
+@njit(cache=True)
+def contar_soluciones(n):
+    """Cuenta las soluciones aprovechando la simetría vertical del tablero."""
+    vacio = np.empty((0, n), np.int8)
+    mitad = n // 2
+    total = 0
+    for fila in range(mitad):
+        total = _subarbol(n, fila, vacio, total)
+    total *= 2
+    if n % 2 == 1:
+        total = _subarbol(n, mitad, vacio, total)
+    return total
+
+
+def _agrandar(salida: np.ndarray, filas: int, usadas: int) -> np.ndarray:
+    """Copia las primeras `usadas` filas de `salida` a una matriz con al menos `filas` filas."""
+    nueva = np.empty((max(filas, 2 * salida.shape[0]), salida.shape[1]), np.int8)
+    nueva[:usadas] = salida[:usadas]
+    return nueva
+
+
+def resolver(n: int) -> np.ndarray:
+    """
+    Devuelve una matriz (soluciones x n) de int8 con todas las soluciones, en orden
+    lexicográfico. Recorre el árbol una sola vez: la matriz crece al doble cuando un
+    subárbol no entra, y solo ese subárbol se vuelve a recorrer.
+    """
+    salida = np.empty((1024, n), np.int8)
+    mitad = n // 2
+    k = 0
+    n_mitad = 0
+    for fila in range(mitad + n % 2):
+        fin = _subarbol(n, fila, salida, k)
+        if fin > salida.shape[0]:
+            salida = _agrandar(salida, fin, k)
+            _subarbol(n, fila, salida, k)
+        k = fin
+        if fila == mitad - 1:
+            n_mitad = k
+    if k + n_mitad > salida.shape[0]:
+        salida = _agrandar(salida, k + n_mitad, k)
+    # Reflejo vertical de la mitad superior, en orden inverso para mantener el orden
+    salida[k:k + n_mitad] = n - 1 - salida[:n_mitad][::-1]
+    return salida[:k + n_mitad]
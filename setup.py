@@ -0,0 +1,35 @@
+"""
+Compila las extensiones opcionales del resolver:
+    python setup.py build_ext --inplace
+- nreinas_core.pyx (Cython): es_valida / conflictos_en sobre memoryviews. Solo sirve a
+  quien llame a esos métodos públicos con un array('i'); el resolver no los usa.
+  Se compila si Cython está instalado (pip install cython).
+- nreinas.py (mypyc): el módulo completo compilado a C, sin cambios en el código.
+  Solo se compila si se pide con NREINAS_MYPYC=1 (requiere pip install "mypy[mypyc]"):
+      NREINAS_MYPYC=1 python setup.py build_ext --inplace
+  El nreinas.*.so generado tiene prioridad sobre nreinas.py: tras editar nreinas.py hay
+  que recompilar o borrarlo, o se seguirá ejecutando la versión vieja.
+main.py funciona sin ninguna de las dos (usa las versiones en Python puro).
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    print("Cython no está instalado: se omite nreinas_core.pyx")
+else:
+    ext_modules += cythonize(["nreinas_core.pyx"], language_level=3)
+
+if os.environ.get("NREINAS_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules += mypycify(["nreinas.py"])
+
+setup(
+    name="clase-2-algoritmos",
+    ext_modules=ext_modules,
+)